@@ -35,6 +35,14 @@ TEMPLATES = [
 ]
 
 
+def render_template(template, otp_mmap):
+    '''Render a Mako template next to its source, dropping the .tpl suffix'''
+    with open(template, 'r') as tplfile:
+        tpl = Template(tplfile.read())
+    with open(Path(template).with_suffix(''), 'w') as outfile:
+        outfile.write(tpl.render(otp_mmap=otp_mmap))
+
+
 def main():
     log.basicConfig(level=log.INFO,
                     format="%(levelname)s: %(message)s")
@@ -55,45 +63,37 @@ def main():
     with open(MMAP_DEFINITION_FILE, 'r') as infile:
         config = hjson.load(infile)
 
-        # If specified, override the seed for random netlist constant computation.
-        if args.seed:
-            log.warning('Commandline override of seed with {}.'.format(
-                args.seed))
-            config['seed'] = args.seed
-        # Otherwise, we either take it from the .hjson if present, or
-        # randomly generate a new seed if not.
-        else:
-            random.seed()
-            new_seed = random.getrandbits(64)
-            if config.setdefault('seed', new_seed) == new_seed:
-                log.warning(
-                    'No seed specified, setting to {}.'.format(new_seed))
-
-        try:
-            otp_mmap = OtpMemMap(config)
-        except RuntimeError as err:
-            log.error(err)
-            exit(1)
-
-        with open(PARTITIONS_TABLE_FILE, 'w') as outfile:
-            outfile.write(TABLE_HEADER_COMMENT +
-                          otp_mmap.create_partitions_table())
-
-        with open(DIGESTS_TABLE_FILE, 'w') as outfile:
-            outfile.write(TABLE_HEADER_COMMENT +
-                          otp_mmap.create_digests_table())
-
-        with open(MMAP_TABLE_FILE, 'w') as outfile:
-            outfile.write(TABLE_HEADER_COMMENT + otp_mmap.create_mmap_table())
-
-        # render all templates
-        for template in TEMPLATES:
-            with open(template, 'r') as tplfile:
-                tpl = Template(tplfile.read())
-                with open(
-                        Path(template).parent.joinpath(Path(template).stem),
-                        'w') as outfile:
-                    outfile.write(tpl.render(otp_mmap=otp_mmap))
+    # If specified, override the seed for random netlist constant computation.
+    if args.seed:
+        log.warning('Commandline override of seed with {}.'.format(args.seed))
+        config['seed'] = args.seed
+    # Otherwise, we either take it from the .hjson if present, or
+    # randomly generate a new seed if not.
+    else:
+        random.seed()
+        new_seed = random.getrandbits(64)
+        if config.setdefault('seed', new_seed) == new_seed:
+            log.warning('No seed specified, setting to {}.'.format(new_seed))
+
+    try:
+        otp_mmap = OtpMemMap(config)
+    except RuntimeError as err:
+        log.error(err)
+        exit(1)
+
+    with open(PARTITIONS_TABLE_FILE, 'w') as outfile:
+        outfile.write(TABLE_HEADER_COMMENT +
+                      otp_mmap.create_partitions_table())
+
+    with open(DIGESTS_TABLE_FILE, 'w') as outfile:
+        outfile.write(TABLE_HEADER_COMMENT + otp_mmap.create_digests_table())
+
+    with open(MMAP_TABLE_FILE, 'w') as outfile:
+        outfile.write(TABLE_HEADER_COMMENT + otp_mmap.create_mmap_table())
+
+    # render all templates
+    for template in TEMPLATES:
+        render_template(template, otp_mmap)
 
 
 if __name__ == "__main__":